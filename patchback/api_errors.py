@@ -0,0 +1,18 @@
+"""Module dedicated to recognizing GitHub API errors."""
+
+import http
+
+
+INTEGRATION_ACCESS_ERROR_MSG = 'Resource not accessible by integration'
+
+
+def is_integration_access_error(bad_req_err):
+    """Check whether the App Installation lacks privileges for a request.
+
+    This relies on the structured exception fields rather than on its
+    string representation.
+    """
+    return (
+        bad_req_err.status_code == http.HTTPStatus.FORBIDDEN and
+        bad_req_err.args == (INTEGRATION_ACCESS_ERROR_MSG, )
+    )
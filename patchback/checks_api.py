@@ -1,8 +1,15 @@
-import http
-from datetime import datetime
+from datetime import datetime, timezone
 
 from gidgethub import BadRequest
 
+from .api_errors import (
+    INTEGRATION_ACCESS_ERROR_MSG, is_integration_access_error,
+)
+
+
+def _utc_now_iso():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
 
 class ChecksAPI:
     def __init__(self, *, api, repo_slug, branch_name):
@@ -29,19 +36,17 @@ class ChecksAPI:
                     # NOTE: HEAD. This is a bit imprecise but
                     # NOTE: it is what it is.
                     'head_sha': commit_sha,
-                    'status': 'queued',
-                    'started_at': f'{datetime.utcnow().isoformat()}Z',
+                    'status': 'in_progress',
+                    'started_at': _utc_now_iso(),
                 },
             )
         except BadRequest as bad_req_err:
-            err_msg = str(bad_req_err)
-            if (
-                    bad_req_err.status_code != http.client.FORBIDDEN or
-                    err_msg != 'Resource not accessible by integration'
-            ):
+            if not is_integration_access_error(bad_req_err):
                 raise
 
-            raise PermissionError(err_msg) from bad_req_err
+            raise PermissionError(
+                INTEGRATION_ACCESS_ERROR_MSG,
+            ) from bad_req_err
         else:
             self._check_runs_updates_uri = (
                 f'{self._check_runs_base_uri}/{checks_resp["id"]:d}'
@@ -51,11 +56,12 @@ class ChecksAPI:
         payload = {
             'name': self._check_run_name,
             'status': 'in_progress',
+            **extra_params,
         }
-        if extra_params.get('status') == 'completed':
-            payload['completed_at'] = f'{datetime.utcnow().isoformat()}Z'
+        if payload['status'] == 'completed':
+            payload['completed_at'] = _utc_now_iso()
         await self._api.patch(
             self._check_runs_updates_uri,
             preview_api_version=self._preview_api_version,
-            data=dict(payload, **extra_params),
+            data=payload,
         )
@@ -72,25 +72,6 @@ class PullRequestReporter:
             self._use_checks_api = True
             _logger.info('Checks API is available')
 
-            await self._checks_api.update_check()
-
-    async def update_progress(
-            self,
-            *,
-            subtitle, text, summary,
-    ):
-        checks_output = await self._make_comment_from_details(
-            subtitle, text, summary,
-        )
-
-        if not self._use_checks_api:
-            return
-
-        await self._checks_api.update_check(
-            status='in_progress',
-            output=checks_output,
-        )
-
     async def finish_reporting(
             self,
             *,
@@ -0,0 +1,62 @@
+"""Module dedicated to reusing GitHub App installation access tokens."""
+
+import asyncio
+import functools
+from datetime import datetime, timedelta, timezone
+
+from octomachinery.app.runtime.context import RUNTIME_CONTEXT
+
+
+TOKEN_EXPIRY_MARGIN = timedelta(minutes=5)
+"""How long before its expiration a token stops being reused."""
+
+_installation_tokens = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tokens_lock():
+    """Return a lock guarding the token cache.
+
+    It's made lazily so that it's bound to the running event loop.
+    """
+    return asyncio.Lock()
+
+
+def _is_reusable(access_token):
+    """Check whether the token is valid long enough to be used."""
+    return (
+        access_token is not None and
+        access_token.expires_at - datetime.now(timezone.utc) >
+        TOKEN_EXPIRY_MARGIN
+    )
+
+
+async def get_installation_token():
+    """Return an access token of the current GitHub App installation.
+
+    The tokens are valid for an hour so they are cached per installation
+    instead of being requested from GitHub for each backport.
+    """
+    install_id = RUNTIME_CONTEXT.github_event.payload['installation']['id']
+    access_token = _installation_tokens.get(install_id)
+    if _is_reusable(access_token):
+        return access_token.token
+
+    async with _get_tokens_lock():
+        access_token = _installation_tokens.get(install_id)
+        if not _is_reusable(access_token):
+            access_token = await RUNTIME_CONTEXT.app_installation.get_token()
+            _installation_tokens[install_id] = access_token
+
+    return access_token.token
+
+
+def invalidate_installation_token():
+    """Forget the cached token of the current GitHub App installation.
+
+    This is needed when the token lacked privileges because the tokens
+    keep the permissions they were issued with. The next backport then
+    gets a token with any permissions granted in the meantime.
+    """
+    install_id = RUNTIME_CONTEXT.github_event.payload['installation']['id']
+    _installation_tokens.pop(install_id, None)